@@ -1,26 +1,73 @@
 """Playwright browser automation for capturing page resources."""
 
 import asyncio
+import itertools
+import tempfile
 from dataclasses import dataclass
+from pathlib import Path
 
-from playwright.async_api import Page, Response, async_playwright
+from playwright.async_api import Browser, Page, Response, Route, async_playwright
 
-from .utils import should_skip_url
+from .utils import should_skip_url, write_file
+
+# Maximum number of response bodies fetched from the browser at once
+MAX_CONCURRENT_BODY_FETCHES = 32
 
 
 @dataclass
 class CapturedResource:
-    """A captured network resource."""
+    """A captured network resource.
+
+    The body is written to a staging file as soon as it is captured rather
+    than held in memory, so large pages don't need all bodies in RAM at once.
+    """
 
     url: str
     content_type: str
-    body: bytes
+    body_path: Path
+
+
+class BrowserPool:
+    """Keeps a single headless Chromium instance alive across captures.
+
+    Launching Chromium takes far longer than capturing a small page, so
+    callers capturing several pages should launch it once and pass it to
+    each capture_page_resources call:
+
+        async with BrowserPool() as browser:
+            for url in urls:
+                await capture_page_resources(url, browser=browser, staging_dir=staging_dir)
+    """
+
+    def __init__(self):
+        self._playwright = None
+        self.browser: Browser | None = None
+
+    async def __aenter__(self) -> Browser:
+        self._playwright = await async_playwright().start()
+        try:
+            self.browser = await self._playwright.chromium.launch(headless=True)
+        except Exception:
+            await self._playwright.stop()
+            raise
+        return self.browser
+
+    async def __aexit__(self, *exc_info) -> None:
+        try:
+            await self.browser.close()
+        finally:
+            await self._playwright.stop()
 
 
 async def capture_page_resources(
     url: str,
     wait_time: int = 0,
     on_status: callable = None,
+    queue: asyncio.Queue | None = None,
+    browser: Browser | None = None,
+    skip_resource_types: set[str] | None = None,
+    *,
+    staging_dir: Path,
 ) -> list[CapturedResource]:
     """Load a page and capture all network resources.
 
@@ -28,22 +75,76 @@ async def capture_page_resources(
         url: URL of the page to load.
         wait_time: Additional seconds to wait after page load for JS content.
         on_status: Optional callback for status updates (receives string message).
+        queue: Optional queue that each resource is also pushed to as soon as
+            it is captured, so consumers can process it while the page loads.
+        browser: Optional already-running browser (see BrowserPool) to reuse.
+            If omitted, a browser is launched and closed for this call.
+        skip_resource_types: Playwright resource types (e.g. "image", "font",
+            "media") whose requests are aborted instead of downloaded.
+        staging_dir: Existing directory owned by the caller, where response
+            bodies are staged (in a fresh subdirectory per call). Saving moves
+            files out of it; anything left over, such as skipped external
+            resources or bodies from a failed load, stays there until the
+            caller removes the directory.
 
     Returns:
-        List of captured resources with their content.
+        List of captured resources, with bodies staged on disk.
 
     Raises:
         Exception: If browser launch or page load fails.
     """
     captured: list[CapturedResource] = []
-    pending_responses: list[Response] = []
+    in_flight: set[asyncio.Task] = set()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_BODY_FETCHES)
+
+    # Bodies finish fetching in any order, but resources are released (to
+    # `captured` and the queue) in response-event order, so duplicate names
+    # are deduplicated deterministically downstream. Finished results wait
+    # in `finished`, keyed by sequence number, until everything before them
+    # has been released; None marks a response whose body was dropped.
+    response_seq = itertools.count()
+    finished: dict[int, CapturedResource | None] = {}
+    next_release = 0
 
     def _status(msg: str) -> None:
         if on_status:
             on_status(msg)
 
-    async def handle_response(response: Response) -> None:
-        """Collect successful responses for later processing."""
+    def release_finished() -> None:
+        """Release finished resources that are next in response order."""
+        nonlocal next_release
+        while next_release in finished:
+            resource = finished.pop(next_release)
+            next_release += 1
+            if resource is None:
+                continue
+            captured.append(resource)
+            if queue is not None:
+                queue.put_nowait(resource)
+
+    async def capture_response(response: Response, seq: int) -> None:
+        """Fetch a response body as soon as it arrives and stage it on disk."""
+        resource = None
+        try:
+            async with semaphore:
+                body = await response.body()
+                body_path = stage_dir / str(seq)
+                await asyncio.to_thread(write_file, body_path, body)
+            resource = CapturedResource(
+                url=response.url,
+                content_type=response.headers.get("content-type", ""),
+                body_path=body_path,
+            )
+        except Exception:
+            # Request may have been cancelled or redirected mid-flight,
+            # or the body couldn't be staged
+            pass
+        finally:
+            finished[seq] = resource
+            release_finished()
+
+    def handle_response(response: Response) -> None:
+        """Start capturing successful responses while the page keeps loading."""
         # Skip non-successful responses
         if not response.ok:
             return
@@ -52,50 +153,71 @@ async def capture_page_resources(
         if should_skip_url(response.url):
             return
 
-        pending_responses.append(response)
+        task = asyncio.create_task(capture_response(response, next(response_seq)))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
 
-    async with async_playwright() as p:
+    async def handle_route(route: Route) -> None:
+        """Abort requests for resource types the caller doesn't want."""
+        if route.request.resource_type in skip_resource_types:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    if browser is None:
         _status("Launching browser...")
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(
-            # Accept all content types
-            accept_downloads=True,
-            # Bypass some security for resource capture
-            bypass_csp=True,
-        )
+        async with BrowserPool() as browser:
+            return await capture_page_resources(
+                url,
+                wait_time=wait_time,
+                on_status=on_status,
+                queue=queue,
+                browser=browser,
+                skip_resource_types=skip_resource_types,
+                staging_dir=staging_dir,
+            )
+
+    stage_dir = Path(tempfile.mkdtemp(prefix="capture_", dir=staging_dir))
+    context = await browser.new_context(
+        # Accept all content types
+        accept_downloads=True,
+        # Bypass some security for resource capture
+        bypass_csp=True,
+    )
+    try:
         page = await context.new_page()
 
         # Register response handler BEFORE navigation
         page.on("response", handle_response)
-
-        _status(f"Navigating to {url}...")
         try:
-            await page.goto(url, wait_until="networkidle", timeout=60000)
-        except Exception as e:
-            await browser.close()
-            raise RuntimeError(f"Failed to load page: {e}") from e
-
-        # Additional wait time for SPAs/lazy-loaded content
-        if wait_time > 0:
-            _status(f"Waiting {wait_time}s for additional content...")
-            await asyncio.sleep(wait_time)
-
-        # Process all collected responses
-        _status(f"Processing {len(pending_responses)} responses...")
-        for response in pending_responses:
+            # Only intercept when needed, since routing every request has a cost
+            if skip_resource_types:
+                await page.route("**/*", handle_route)
+
+            _status(f"Navigating to {url}...")
             try:
-                body = await response.body()
-                content_type = response.headers.get("content-type", "")
-                captured.append(CapturedResource(
-                    url=response.url,
-                    content_type=content_type,
-                    body=body,
-                ))
-            except Exception:
-                # Response body may no longer be available (e.g., redirects)
-                # Just skip it
-                pass
-
-        await browser.close()
+                await page.goto(url, wait_until="networkidle", timeout=60000)
+            except Exception as e:
+                raise RuntimeError(f"Failed to load page: {e}") from e
+
+            # Additional wait time for SPAs/lazy-loaded content
+            if wait_time > 0:
+                _status(f"Waiting {wait_time}s for additional content...")
+                await asyncio.sleep(wait_time)
+        finally:
+            # On every exit path, stop capturing new responses so nothing is
+            # started (or queued) after the drain below
+            page.remove_listener("response", handle_response)
+            if skip_resource_types:
+                await page.unroute("**/*", handle_route)
+
+            # Let body fetches still in progress finish before closing, so
+            # none of them writes to the staging dir after we've returned
+            # (capture_response swallows its own errors, so this won't raise)
+            if in_flight:
+                _status(f"Processing {len(in_flight)} remaining responses...")
+                await asyncio.gather(*in_flight)
+    finally:
+        await context.close()
 
     return captured
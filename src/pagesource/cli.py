@@ -1,6 +1,8 @@
 """CLI entry point for pagesource."""
 
 import asyncio
+import sys
+import tempfile
 from pathlib import Path
 from typing import Optional
 
@@ -9,9 +11,18 @@ from rich.console import Console
 
 from . import __version__
 from .browser import capture_page_resources
-from .downloader import save_resources
+from .downloader import ResourceSaver, start_save_workers, stop_save_workers
 from .utils import parse_url
 
+# Optional faster event loop (pip install pagesource[fast]); not available on Windows
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+else:
+    uvloop = None
+
 app = typer.Typer(
     name="pagesource",
     help="Capture all resources from a webpage like browser DevTools Sources tab.",
@@ -26,6 +37,53 @@ def version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
+def run_async(coro):
+    """Run a coroutine to completion, on uvloop if it is installed."""
+    if uvloop is None:
+        return asyncio.run(coro)
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    uvloop.install()
+    return asyncio.run(coro)
+
+
+async def capture_and_save(
+    url: str,
+    output: Path,
+    wait_time: int,
+    include_external: bool,
+    on_status: callable = None,
+    skip_resource_types: set[str] | None = None,
+) -> tuple[int, int, int]:
+    """Capture a page and save its resources to disk as they arrive.
+
+    Returns:
+        Tuple of (captured_count, saved_count, skipped_count, failed_count).
+    """
+    saver = ResourceSaver(output, url, include_external)
+    queue: asyncio.Queue = asyncio.Queue()
+    workers = start_save_workers(queue, saver)
+    # Stage bodies inside the output directory so saving is a same-filesystem rename
+    with tempfile.TemporaryDirectory(prefix=".pagesource_staging_", dir=output) as staging_dir:
+        try:
+            resources = await capture_page_resources(
+                url,
+                wait_time=wait_time,
+                on_status=on_status,
+                queue=queue,
+                skip_resource_types=skip_resource_types,
+                staging_dir=Path(staging_dir),
+            )
+            if on_status:
+                on_status("Saving resources to disk...")
+            await queue.join()
+        finally:
+            await stop_save_workers(workers)
+
+    return len(resources), saver.saved, saver.skipped, saver.failed
+
+
 @app.command()
 def capture(
     url: str = typer.Argument(
@@ -47,6 +105,21 @@ def capture(
         "--include-external", "-e",
         help="Include external resources (CDN assets, third-party scripts).",
     ),
+    skip_images: bool = typer.Option(
+        False,
+        "--skip-images",
+        help="Don't download images.",
+    ),
+    skip_fonts: bool = typer.Option(
+        False,
+        "--skip-fonts",
+        help="Don't download fonts.",
+    ),
+    skip_media: bool = typer.Option(
+        False,
+        "--skip-media",
+        help="Don't download audio and video.",
+    ),
     version: bool = typer.Option(
         False,
         "--version", "-v",
@@ -77,14 +150,33 @@ def capture(
     if include_external:
         console.print("[dim]Including external resources[/dim]")
 
-    # Capture resources
+    # Resource types to block in the browser
+    skip_resource_types = set()
+    if skip_images:
+        skip_resource_types.add("image")
+    if skip_fonts:
+        skip_resource_types.add("font")
+    if skip_media:
+        skip_resource_types.add("media")
+
+    if skip_resource_types:
+        console.print(f"[dim]Skipping resource types: {', '.join(sorted(skip_resource_types))}[/dim]")
+
+    # Capture resources, saving each one while the page is still loading
     try:
         with console.status("[bold blue]Loading page and capturing resources...") as status:
             def on_status(msg: str) -> None:
                 status.update(f"[bold blue]{msg}")
 
-            resources = asyncio.run(
-                capture_page_resources(full_url, wait_time=wait, on_status=on_status)
+            captured, saved, skipped, failed = run_async(
+                capture_and_save(
+                    full_url,
+                    output,
+                    wait,
+                    include_external,
+                    on_status=on_status,
+                    skip_resource_types=skip_resource_types,
+                )
             )
     except RuntimeError as e:
         console.print(f"[red]Error: {e}[/red]")
@@ -94,21 +186,14 @@ def capture(
         console.print("\n[yellow]Cancelled by user[/yellow]")
         raise typer.Exit(130)
 
-    console.print(f"[green]OK[/green] Captured {len(resources)} resources")
-
-    # Save resources
-    if resources:
-        with console.status("[bold blue]Saving resources to disk..."):
-            saved, skipped = save_resources(
-                resources,
-                output,
-                full_url,
-                include_external=include_external,
-            )
+    console.print(f"[green]OK[/green] Captured {captured} resources")
 
+    if captured:
         console.print(f"[green]OK[/green] Saved {saved} resources")
         if skipped > 0:
             console.print(f"[dim]Skipped {skipped} external resources (use --include-external to include)[/dim]")
+        if failed > 0:
+            console.print(f"[yellow]Failed to save {failed} resources (see warnings above)[/yellow]")
     else:
         console.print("[yellow]No resources captured[/yellow]")
 
@@ -1,11 +1,40 @@
 """Save captured resources to disk with directory structure."""
 
+import asyncio
+import errno
+import os
+import shutil
 from pathlib import Path
+from urllib.parse import urlparse
 
 from rich.console import Console
 
 from .browser import CapturedResource
-from .utils import infer_extension, is_same_origin, url_to_local_path
+from .utils import (
+    _host_to_dir,
+    _is_same_origin_parsed,
+    _url_to_local_path_parsed,
+    infer_extension,
+)
+
+# Maximum number of files written to disk at once
+MAX_CONCURRENT_WRITES = 16
+
+
+def _move_file(src: Path, dst: Path) -> None:
+    """Move a file, falling back to copy+delete across filesystems.
+
+    Args:
+        src: Existing file to move.
+        dst: Destination path (overwritten if it exists).
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.copyfile(src, dst)
+        os.unlink(src)
 
 
 class ResourceSaver:
@@ -22,7 +51,19 @@ class ResourceSaver:
         self.output_dir = output_dir
         self.base_url = base_url
         self.include_external = include_external
-        self.used_paths: set[Path] = set()
+        self._base_netloc = urlparse(base_url).netloc
+        # Sanitized per-host output directories, keyed by netloc
+        self._host_dirs: dict[str, str] = {
+            self._base_netloc: _host_to_dir(self._base_netloc, output_dir),
+        }
+        self.used_paths: set[str] = set()
+        # Last numeric suffix handed out per (parent, stem, extension)
+        self._stem_counters: dict[tuple[str, str, str], int] = {}
+        # Directories known to exist, to skip redundant mkdir calls
+        self._created_dirs: set[Path] = set()
+        self.saved = 0
+        self.skipped = 0
+        self.failed = 0
         self.console = Console()
 
     def _deduplicate_path(self, path: Path) -> Path:
@@ -34,59 +75,175 @@ class ResourceSaver:
         Returns:
             Path that doesn't conflict with already-used paths.
         """
-        if path not in self.used_paths:
-            self.used_paths.add(path)
+        # Paths are tracked as strings, which hash faster than Path objects
+        path_key = str(path)
+        if path_key not in self.used_paths:
+            self.used_paths.add(path_key)
             return path
 
         stem = path.stem
         ext = path.suffix
         parent = path.parent
-        counter = 1
+
+        # Resume from the last suffix used for this name, so repeated
+        # collisions don't re-probe every earlier suffix
+        key = (str(parent), stem, ext)
+        counter = self._stem_counters.get(key, 0)
 
         while True:
+            counter += 1
             new_path = parent / f"{stem}_{counter}{ext}"
-            if new_path not in self.used_paths:
-                self.used_paths.add(new_path)
+            new_key = str(new_path)
+            if new_key not in self.used_paths:
+                self._stem_counters[key] = counter
+                self.used_paths.add(new_key)
                 return new_path
-            counter += 1
 
-    def save_resource(self, resource: CapturedResource) -> Path | None:
-        """Save a single resource to disk.
+    def _get_host_dir(self, netloc: str) -> str:
+        """Get the output directory for a host, sanitizing each host only once."""
+        host_dir = self._host_dirs.get(netloc)
+        if host_dir is None:
+            host_dir = _host_to_dir(netloc, self.output_dir)
+            self._host_dirs[netloc] = host_dir
+        return host_dir
+
+    def resolve_path(self, resource: CapturedResource) -> Path | None:
+        """Work out where a resource should be saved.
 
         Args:
-            resource: The captured resource to save.
+            resource: The captured resource to place.
 
         Returns:
-            Path where resource was saved, or None if skipped.
+            Unique local path for the resource, or None if it should be skipped.
         """
+        parsed = urlparse(resource.url)
+
         # Filter external resources if not included
-        if not self.include_external and not is_same_origin(resource.url, self.base_url):
+        if not self.include_external and not _is_same_origin_parsed(parsed, self._base_netloc):
             return None
 
         # Get base path from URL
-        local_path = url_to_local_path(resource.url, self.output_dir)
+        path_str = _url_to_local_path_parsed(parsed, self._get_host_dir(parsed.netloc))
 
         # Infer extension from content-type if needed
-        path_str = str(local_path)
-        path_with_ext = infer_extension(path_str, resource.content_type)
-        local_path = Path(path_with_ext)
+        local_path = Path(infer_extension(path_str, resource.content_type))
 
         # Deduplicate if path already used
-        local_path = self._deduplicate_path(local_path)
+        return self._deduplicate_path(local_path)
 
-        # Create parent directories
-        local_path.parent.mkdir(parents=True, exist_ok=True)
+    def _ensure_dir(self, directory: Path) -> None:
+        """Create a directory (and parents) unless it is already known to exist.
 
-        # Write content
+        Args:
+            directory: Directory to create.
+        """
+        if directory in self._created_dirs:
+            return
+
+        directory.mkdir(parents=True, exist_ok=True)
+
+        # Only mark as created after mkdir succeeds, since other worker
+        # threads may be checking the set concurrently
+        self._created_dirs.add(directory)
+        self._created_dirs.update(directory.parents)
+
+    def write_resource(self, resource: CapturedResource, local_path: Path) -> Path | None:
+        """Move a resource's staged content to an already-resolved path.
+
+        Safe to call from worker threads as long as each path is unique.
+
+        Args:
+            resource: The captured resource to write.
+            local_path: Destination path from resolve_path.
+
+        Returns:
+            Path where resource was saved, or None if writing failed.
+        """
         try:
-            local_path.write_bytes(resource.body)
+            # Create parent directories
+            self._ensure_dir(local_path.parent)
+
+            # Move the staged body into place
+            _move_file(resource.body_path, local_path)
             return local_path
         except OSError as e:
             self.console.print(f"[yellow]Warning: Could not save {resource.url}: {e}[/yellow]")
             return None
 
+    def save_resource(self, resource: CapturedResource) -> Path | None:
+        """Save a single resource to disk.
+
+        Args:
+            resource: The captured resource to save.
+
+        Returns:
+            Path where resource was saved, or None if skipped.
+        """
+        local_path = self.resolve_path(resource)
+        if local_path is None:
+            return None
+        return self.write_resource(resource, local_path)
+
+
+async def save_worker(queue: asyncio.Queue, saver: ResourceSaver) -> None:
+    """Save resources from a queue until cancelled.
+
+    Paths are resolved on the event loop (so deduplication stays serial),
+    while the file write itself runs in a worker thread. Results are tallied
+    on saver.saved, saver.skipped (filtered out, e.g. external) and
+    saver.failed (could not be written, or raised an unexpected error).
+
+    Args:
+        queue: Queue of CapturedResource objects to save.
+        saver: Saver used to place and write each resource.
+    """
+    while True:
+        resource = await queue.get()
+        try:
+            local_path = saver.resolve_path(resource)
+            if local_path is None:
+                saver.skipped += 1
+            elif await asyncio.to_thread(saver.write_resource, resource, local_path):
+                saver.saved += 1
+            else:
+                saver.failed += 1
+        except Exception as e:
+            # Keep the worker alive: a dead worker would lose the rest of
+            # the queue and leave queue.join() waiting forever
+            saver.console.print(f"[yellow]Warning: Could not save {resource.url}: {e}[/yellow]")
+            saver.failed += 1
+        finally:
+            queue.task_done()
+
 
-def save_resources(
+def start_save_workers(queue: asyncio.Queue, saver: ResourceSaver) -> list[asyncio.Task]:
+    """Spawn background tasks that save resources pushed onto a queue.
+
+    Args:
+        queue: Queue of CapturedResource objects to save.
+        saver: Saver used to place and write each resource.
+
+    Returns:
+        The worker tasks; cancel them once queue.join() has returned.
+    """
+    return [
+        asyncio.create_task(save_worker(queue, saver))
+        for _ in range(MAX_CONCURRENT_WRITES)
+    ]
+
+
+async def stop_save_workers(workers: list[asyncio.Task]) -> None:
+    """Cancel save workers and wait for them to exit.
+
+    Args:
+        workers: Tasks returned by start_save_workers.
+    """
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def save_resources(
     resources: list[CapturedResource],
     output_dir: Path,
     base_url: str,
@@ -101,18 +258,18 @@ def save_resources(
         include_external: Whether to save external (CDN) resources.
 
     Returns:
-        Tuple of (saved_count, skipped_count).
+        Tuple of (saved_count, skipped_count), where skipped_count covers
+        every resource not saved, whether filtered out or failed.
     """
     saver = ResourceSaver(output_dir, base_url, include_external)
-
-    saved = 0
-    skipped = 0
-
+    queue: asyncio.Queue = asyncio.Queue()
     for resource in resources:
-        result = saver.save_resource(resource)
-        if result is not None:
-            saved += 1
-        else:
-            skipped += 1
+        queue.put_nowait(resource)
+
+    workers = start_save_workers(queue, saver)
+    try:
+        await queue.join()
+    finally:
+        await stop_save_workers(workers)
 
-    return saved, skipped
+    return saver.saved, saver.skipped + saver.failed
@@ -1,5 +1,7 @@
 """URL parsing, path sanitization, and utility functions."""
 
+import functools
+import os
 import re
 from pathlib import Path
 from urllib.parse import ParseResult, unquote, urlparse
@@ -50,8 +52,14 @@ CONTENT_TYPE_MAP: dict[str, str] = {
     "video/ogg": ".ogv",
 }
 
-# Characters invalid in filenames (Windows-focused for cross-platform compat)
-INVALID_CHARS = re.compile(r'[<>:"|?*\x00-\x1f\\]')
+# Leading MIME type of a Content-Type header (before any ;charset=... params)
+_MIME_RE = re.compile(r"\s*([^;\s]+)")
+
+# Characters invalid in filenames (Windows-focused for cross-platform compat),
+# mapped to "_" for use with str.translate
+_SANITIZE_TABLE = str.maketrans(
+    dict.fromkeys('<>:"|?*\\' + "".join(chr(i) for i in range(32)), "_")
+)
 
 # Windows reserved names
 WINDOWS_RESERVED = frozenset({
@@ -60,6 +68,13 @@ WINDOWS_RESERVED = frozenset({
     "LPT1", "LPT2", "LPT3", "LPT4", "LPT5", "LPT6", "LPT7", "LPT8", "LPT9",
 })
 
+# URL schemes that can't be saved as files
+SKIP_URL_PREFIXES = ("data:", "blob:", "about:", "javascript:", "chrome:", "chrome-extension:")
+_SKIP_FIRST_CHARS = frozenset(prefix[0] for prefix in SKIP_URL_PREFIXES)
+
+# O_BINARY only exists (and matters) on Windows
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
 MAX_PATH_COMPONENT = 100
 MAX_FILENAME_LENGTH = 200
 
@@ -91,6 +106,7 @@ def parse_url(url: str) -> ParseResult:
     return parsed
 
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_path_component(name: str) -> str:
     """Clean a path component for filesystem safety.
 
@@ -104,7 +120,7 @@ def sanitize_path_component(name: str) -> str:
         return "_"
 
     # Remove invalid characters
-    name = INVALID_CHARS.sub("_", name)
+    name = name.translate(_SANITIZE_TABLE)
 
     # Handle Windows reserved names
     name_upper = name.upper()
@@ -153,17 +169,28 @@ def infer_extension(path: str, content_type: str) -> str:
     Returns:
         Path with extension added if needed.
     """
-    filename = Path(path).name
-
-    # Check if already has an extension
-    if "." in filename:
+    # Check if the last component already has an extension
+    if "." in os.path.basename(path):
         return path
 
-    # Parse content-type (ignore charset, boundary, etc.)
-    mime = content_type.split(";")[0].strip().lower()
-    ext = CONTENT_TYPE_MAP.get(mime, "")
+    return path + _mime_to_ext(content_type)
+
+
+@functools.lru_cache(maxsize=64)
+def _mime_to_ext(content_type: str) -> str:
+    """Map a Content-Type header value to a file extension.
 
-    return path + ext
+    Args:
+        content_type: Content-Type header value.
+
+    Returns:
+        Extension including the dot, or empty string if unknown.
+    """
+    # Parse content-type (ignore charset, boundary, etc.)
+    match = _MIME_RE.match(content_type)
+    if not match:
+        return ""
+    return CONTENT_TYPE_MAP.get(match.group(1).lower(), "")
 
 
 def is_same_origin(url: str, base_url: str) -> bool:
@@ -176,9 +203,12 @@ def is_same_origin(url: str, base_url: str) -> bool:
     Returns:
         True if both URLs have the same origin (scheme + host).
     """
-    parsed_url = urlparse(url)
-    parsed_base = urlparse(base_url)
-    return parsed_url.netloc == parsed_base.netloc
+    return _is_same_origin_parsed(urlparse(url), urlparse(base_url).netloc)
+
+
+def _is_same_origin_parsed(parsed: ParseResult, base_netloc: str) -> bool:
+    """Same-origin check against an already-parsed URL and base netloc."""
+    return parsed.netloc == base_netloc
 
 
 def url_to_local_path(url: str, output_dir: Path) -> Path:
@@ -192,11 +222,25 @@ def url_to_local_path(url: str, output_dir: Path) -> Path:
         Local path where the resource should be saved.
     """
     parsed = urlparse(url)
+    return Path(_url_to_local_path_parsed(parsed, _host_to_dir(parsed.netloc, output_dir)))
+
 
-    # Get host (strip port for directory name)
-    host = parsed.netloc.split(":")[0]
-    host = sanitize_path_component(host)
+def _host_to_dir(netloc: str, output_dir: Path) -> str:
+    """Directory under output_dir (as a string) that a host's resources are saved in."""
+    # Strip port for directory name
+    host = netloc.split(":")[0]
+    return os.path.join(output_dir, sanitize_path_component(host))
 
+
+@functools.lru_cache(maxsize=4096)
+def _url_to_local_path_parsed(parsed: ParseResult, host_dir: str) -> str:
+    """Build the local path string for an already-parsed URL under its host directory.
+
+    Works on plain strings rather than Path objects to avoid per-component
+    allocations; callers convert to Path when they need one. Memoized, since
+    the same URL can produce several responses (SPA re-requests, service
+    worker replays).
+    """
     # Get path and decode URL encoding
     url_path = unquote(parsed.path)
 
@@ -213,9 +257,7 @@ def url_to_local_path(url: str, output_dir: Path) -> Path:
     sanitized_parts = [sanitize_path_component(part) for part in path_parts]
 
     # Build full local path
-    local_path = output_dir / host / Path(*sanitized_parts)
-
-    return local_path
+    return os.path.join(host_dir, *sanitized_parts)
 
 
 def should_skip_url(url: str) -> bool:
@@ -227,5 +269,23 @@ def should_skip_url(url: str) -> bool:
     Returns:
         True if URL should be skipped.
     """
-    skip_prefixes = ("data:", "blob:", "about:", "javascript:", "chrome:", "chrome-extension:")
-    return url.startswith(skip_prefixes)
+    # Cheap first-character check lets ordinary http(s) URLs exit early
+    return url[:1] in _SKIP_FIRST_CHARS and url.startswith(SKIP_URL_PREFIXES)
+
+
+def write_file(path: Path, data: bytes) -> None:
+    """Write bytes to a file with raw os calls, bypassing the buffered io stack.
+
+    Args:
+        path: Destination file path.
+        data: Content to write.
+    """
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        # os.write may write fewer bytes than requested for large buffers
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)